@@ -1,10 +1,25 @@
 import os
+import asyncio
+import concurrent.futures
+import contextlib
+import io
 import json
+import logging
+import random
+import threading
+import time
+import httpx
 import openai
 import weave
 import streamlit as st
-from typing import Dict, List, Optional
-from dataclasses import dataclass
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_random_exponential
+from collections import OrderedDict, deque
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
+from pydantic import PrivateAttr
+
+from objects import OBJECTS_LARGE
 
 # Determine if we're running in a Streamlit Cloud environment
 is_streamlit_cloud = os.environ.get('STREAMLIT_RUNTIME') == 'true'
@@ -13,19 +28,270 @@ if is_streamlit_cloud:
 else:
     api_key = os.getenv("OPENAI_API_KEY")
 
+logger = logging.getLogger(__name__)
+
+# Per-call object line, kept after the stable system prompt so the cacheable prefix is unchanged
+_OBJECT_PREFIX = "The object is '"
+_OBJECT_SUFFIX = "'."
+
+@lru_cache(maxsize=len(OBJECTS_LARGE))
+def object_message(object_name: str) -> Dict:
+    """Return the shared, read-only system message naming the object in play."""
+    return {"role": "system", "content": _OBJECT_PREFIX + object_name + _OBJECT_SUFFIX}
+
+# The only replies allowed on the answer endpoint
+ANSWERS = ("Yes", "No", "Maybe")
+
+# First token of each allowed answer in o200k_base, the gpt-4o family encoding,
+# biased so the single-token reply is one of them. Regenerate if the model changes:
+# [tiktoken.get_encoding("o200k_base").encode(answer)[0] for answer in ANSWERS]
+ANSWER_TOKEN_IDS = (13022, 3160, 34320)
+ANSWER_LOGIT_BIAS = {str(token_id): 100 for token_id in ANSWER_TOKEN_IDS}
+
+def parse_answer(text: str) -> Optional[str]:
+    """Map a single-token reply (e.g. "May" or "yes.") to Yes, No or Maybe.
+
+    Returns None if the reply isn't one of them.
+    """
+    word = text.strip().rstrip(".!,").lower()
+    for answer in ANSWERS:
+        if word and answer.lower().startswith(word):
+            return answer
+    return None
+
+# Errors from parsing a JSON reply that is missing, truncated or not the expected object
+_JSON_ERRORS = (json.JSONDecodeError, KeyError, TypeError)
+
+# Batch statuses that will never produce results
+_BATCH_TERMINAL_FAILURES = ("failed", "expired", "cancelled")
+
+# Objects and hint to fall back on when the model can't be reached
+_FALLBACK_OBJECTS: Tuple[str, ...] = ("pencil", "book", "spoon", "clock", "chair")
+_FALLBACK_HINT = "This object might be found in everyday life."
+
+# Hints generated offline by precompute_hints.py, keyed by object name
+HINTS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "hints.json")
+if os.path.exists(HINTS_PATH):
+    with open(HINTS_PATH) as f:
+        HINTS: Dict[str, List[str]] = json.load(f)
+else:
+    HINTS = {}
+
+# Answers for (object, normalized question) pairs, shared across games and
+# reruns so repeated questions skip the API round-trip. Evicted least-recently-used.
+ANSWER_CACHE_SIZE = 2048
+ANSWER_CACHE_TTL = 24 * 60 * 60
+answer_cache_stats = {"hits": 0, "misses": 0}
+
+@st.cache_resource
+def get_answer_cache() -> "Tuple[OrderedDict[Tuple[str, str], Tuple[float, str]], threading.Lock]":
+    """Return the answer cache, mapping keys to (stored_at, answer), and its lock.
+
+    Survives reruns and is shared by every Streamlit session thread, so all access
+    goes through the lock.
+    """
+    return OrderedDict(), threading.Lock()
+
+def lookup_answer(cache_key: Tuple[str, str]) -> Optional[str]:
+    """Return a cached answer that hasn't expired, counting the hit or miss."""
+    answer_cache, lock = get_answer_cache()
+    with lock:
+        cached = answer_cache.get(cache_key)
+        if cached is None or time.monotonic() - cached[0] >= ANSWER_CACHE_TTL:
+            answer_cache_stats["misses"] += 1
+            return None
+        answer_cache.move_to_end(cache_key)
+        answer_cache_stats["hits"] += 1
+    logger.debug("Answer cache hit (%d hits, %d misses)",
+                 answer_cache_stats["hits"], answer_cache_stats["misses"])
+    return cached[1]
+
+def cache_answer(cache_key: Tuple[str, str], answer: str) -> None:
+    """Store an answer, evicting the least recently used entry."""
+    answer_cache, lock = get_answer_cache()
+    with lock:
+        answer_cache[cache_key] = (time.monotonic(), answer)
+        answer_cache.move_to_end(cache_key)
+        if len(answer_cache) > ANSWER_CACHE_SIZE:
+            answer_cache.popitem(last=False)
+
+# Bounds in-flight answer requests so batched questions don't trip rate limits
+MAX_CONCURRENT_ANSWERS = 10
+
+@st.cache_resource
+def answer_semaphore() -> asyncio.Semaphore:
+    """Return the answer-request semaphore, which binds to the shared event loop."""
+    return asyncio.Semaphore(MAX_CONCURRENT_ANSWERS)
+
 @dataclass
 class GameResponse:
     object_name: str
     hints: List[str]
     qa_response: Optional[str] = None
+    qa_responses: List[str] = field(default_factory=list)
+
+# Per-attempt timeout, so a hung connection is retried instead of blocking for 30s+;
+# keeps the pool's shorter connect timeout
+REQUEST_TIMEOUT = httpx.Timeout(10.0, connect=5.0)
+
+# Retries transient API failures with jittered exponential backoff; anything else fails fast
+retry_transient = retry(
+    stop=stop_after_attempt(3),
+    wait=wait_random_exponential(min=1, max=8),
+    retry=retry_if_exception_type((
+        openai.APITimeoutError,
+        openai.APIConnectionError,
+        openai.RateLimitError,
+        openai.InternalServerError,
+    )),
+    reraise=True,
+)
+
+def log_usage(usage) -> None:
+    """Log a completion's prompt tokens and how many were served from the prompt cache."""
+    details = usage.prompt_tokens_details
+    logger.debug("Prompt tokens: %d (cached: %d)", usage.prompt_tokens,
+                 details.cached_tokens if details else 0)
+
+@retry_transient
+async def create_completion(client, **kwargs):
+    """Create a chat completion, retrying transient failures."""
+    response = await client.chat.completions.create(timeout=REQUEST_TIMEOUT, **kwargs)
+    if response.usage is not None:
+        log_usage(response.usage)
+    return response
+
+@retry_transient
+async def stream_completion(client, on_delta: Optional[Callable[[str], None]] = None,
+                            semaphore: Optional[asyncio.Semaphore] = None, **kwargs) -> Optional[str]:
+    """Stream a chat completion, reporting the accumulated text as tokens arrive.
+
+    The semaphore, if given, is held per attempt, so it is released during retry backoff.
+    Each attempt first sends on_delta an empty string, so text shown by a failed attempt
+    is cleared before the retry streams its own.
+    """
+    if on_delta is not None:
+        on_delta("")
+    async with semaphore if semaphore is not None else contextlib.nullcontext():
+        stream = await client.chat.completions.create(
+            stream=True, stream_options={"include_usage": True}, timeout=REQUEST_TIMEOUT, **kwargs
+        )
+        content = None
+        async for chunk in stream:
+            if chunk.usage is not None:
+                log_usage(chunk.usage)
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content or ""
+            content = (content or "") + delta
+            if on_delta is not None:
+                on_delta(content)
+        return content
+
+@st.cache_resource
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """Return the event loop every model call runs on, started once per process.
+
+    Async connection pools are bound to the loop that opens them, so running all
+    sessions and reruns on this one background loop lets them share a single client
+    instead of reconnecting on every interaction.
+    """
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="twenty-questions-loop", daemon=True).start()
+    return loop
+
+def run(coro):
+    """Run a coroutine on the shared event loop from synchronous code and wait for it."""
+    return asyncio.run_coroutine_threadsafe(coro, get_event_loop()).result()
+
+def _build_client(key: Optional[str]) -> openai.AsyncClient:
+    """Create an OpenAI client with a keep-alive connection pool."""
+    return openai.AsyncClient(
+        api_key=key,
+        # Retries are handled by retry_transient
+        max_retries=0,
+        http_client=httpx.AsyncClient(
+            # Retries failed connection attempts at the transport level; idle
+            # connections are kept for a minute so a game's questions reuse them
+            transport=httpx.AsyncHTTPTransport(
+                retries=3,
+                limits=httpx.Limits(
+                    max_keepalive_connections=20,
+                    max_connections=40,
+                    keepalive_expiry=60,
+                ),
+            ),
+            timeout=httpx.Timeout(30.0, connect=5.0),
+        ),
+    )
+
+@st.cache_resource
+def _clients() -> Dict[Optional[str], openai.AsyncClient]:
+    """Return the shared OpenAI clients, keyed by API key.
+
+    Only touched from the shared event loop's thread, so it needs no lock.
+    """
+    return {}
+
+def get_client(key: Optional[str] = api_key) -> openai.AsyncClient:
+    """Return the shared OpenAI client for an API key, reusing its keep-alive pool."""
+    if asyncio.get_running_loop() is not get_event_loop():
+        raise RuntimeError("OpenAI clients live on the shared event loop; call the model through run()")
+    clients = _clients()
+    if key not in clients:
+        clients[key] = _build_client(key)
+    return clients[key]
+
+async def close_client() -> None:
+    """Close every shared OpenAI client; the next call opens a fresh one."""
+    clients = _clients()
+    while clients:
+        _, client = clients.popitem()
+        await client.close()
+
+@st.cache_resource
+def init_weave():
+    """Initialize Weave at most once per process."""
+    return weave.init("wandb-designers/20questions")
 
 class TwentyQuestionsModel(weave.Model):
-    def __init__(self):
+    # Private, so the key is never serialized into Weave traces or model versions
+    _openai_api_key: Optional[str] = PrivateAttr(default=None)
+    # Per-instance game state, private so it doesn't create a new model version every game
+    _object_pool: deque = PrivateAttr(default_factory=deque)
+    _next_game: Optional[concurrent.futures.Future] = PrivateAttr(default=None)
+
+    def __init__(self, openai_api_key: Optional[str] = None):
         super().__init__()
-        self.model_name = 'gpt-3.5-turbo'
-        self.client = openai.AsyncClient(api_key=api_key)
+        self.model_name = 'gpt-4o-mini'
+        # Defaults to the key from Streamlit secrets or the environment
+        self._openai_api_key = openai_api_key or api_key
+        # New games draw from the curated pool; the model is only asked for an
+        # object once this instance has used every pooled object, or when enabled
+        self.use_llm_objects = os.getenv("LLM_OBJECTS") == "true"
+        # Shuffled once with OS entropy so separate workers don't share a sequence
+        pool = list(OBJECTS_LARGE)
+        random.SystemRandom().shuffle(pool)
+        self._object_pool = deque(pool)
         
-        self.object_prompt_template = """Generate a random object for a 20 questions game. 
+        # The hint and QA templates are kept byte-identical across calls so OpenAI's
+        # automatic prompt caching can reuse the prefix; per-call values go in later messages.
+        self.hint_prompt_template = """Generate a cryptic, clever hint for the object you are given.
+        The hint MUST:
+        - Be abstract or metaphorical
+        - Never mention the object's direct use or common location
+        - Use wordplay, analogies, or indirect references
+        - Be challenging but not impossible to decode
+        - Differ from any previous hints
+        
+        Respond with only the hint itself, as a single sentence."""
+
+        self.qa_prompt_template = """You are playing a 20 questions game. You will be told the object and asked a question about it.
+        Answer accurately, but never reveal what the object is.
+        
+        Respond with exactly one word: Yes, No, or Maybe."""
+
+        self.object_and_hint_prompt_template = """Generate a random object for a 20 questions game, plus a first hint for it.
         The object MUST be:
         - Something extremely common that everyone encounters regularly
         - A single word if possible (two words max)
@@ -33,108 +299,284 @@ class TwentyQuestionsModel(weave.Model):
         - Simple and basic (no specialized equipment)
         - Something a child would recognize
         
-        Examples of good objects:
-        - pencil
-        - book
-        - spoon
-        - clock
-        - chair
-        
-        AVOID:
-        - Specialized items (garden gnome, violin, etc.)
-        - Complex items (laptop, smartphone, etc.)
-        - Brand-specific items
-        - Regional or cultural-specific items
-        - Uncommon or luxury items
+        AVOID specialized, complex, brand-specific, regional or luxury items.
         
-        Respond with a JSON object containing a single field "object": <str>"""
-
-        self.hint_prompt_template = """Generate a cryptic, clever hint for the object '{object}'.
         The hint MUST:
         - Be abstract or metaphorical
         - Never mention the object's direct use or common location
         - Use wordplay, analogies, or indirect references
         - Be challenging but not impossible to decode
         
-        Previous hints: {previous_hints}
-        
-        Respond with a JSON object containing a single field "hint": <str>"""
+        Respond with a JSON object containing two fields "object": <str> and "hint": <str>"""
 
-        self.qa_prompt_template = """You are playing a 20 questions game. The object is '{object}'.
-        Question: {question}
-        
-        Respond with a JSON object containing a single field "answer": <str> that must be either "Yes", "No", or "Maybe"."""
+        # Built once so hint and answer requests only allocate their per-call messages
+        self.hint_system_message = {"role": "system", "content": self.hint_prompt_template}
+        self.qa_system_message = {"role": "system", "content": self.qa_prompt_template}
+
+    @property
+    def client(self) -> openai.AsyncClient:
+        """The shared OpenAI client for this model's API key."""
+        return get_client(self._openai_api_key)
+
+    def draw_object(self) -> Optional[str]:
+        """Pick an unused object from the curated pool, or None once it is exhausted."""
+        return self._object_pool.popleft() if self._object_pool else None
 
     @weave.op()
-    async def predict_object(self) -> Dict:
-        """Generate a random object for the game."""
+    async def predict_object_and_hint(self) -> Dict:
+        """Generate a random object and its first hint in a single call."""
         try:
-            response = await self.client.chat.completions.create(
+            response = await create_completion(
+                self.client,
                 model=self.model_name,
                 messages=[
-                    {"role": "system", "content": self.object_prompt_template}
+                    {"role": "system", "content": self.object_and_hint_prompt_template}
                 ],
+                response_format={"type": "json_object"},
             )
-            result = response.choices[0].message.content
-            if result is None:
-                raise ValueError("No response from model")
-            return json.loads(result)
-        except Exception as e:
-            # Fallback to basic objects if API fails
-            fallback_objects = ["pencil", "book", "spoon", "clock", "chair"]
-            return {"object": random.choice(fallback_objects)}
+        except openai.APIError as e:
+            logger.warning("Object and hint generation failed, using a fallback: %r", e)
+            return {"object": random.choice(_FALLBACK_OBJECTS), "hint": _FALLBACK_HINT}
+        try:
+            parsed = json.loads(response.choices[0].message.content or "")
+            return {"object": parsed["object"], "hint": parsed["hint"]}
+        except _JSON_ERRORS as e:
+            logger.warning("Unusable object and hint reply, using a fallback: %r", e)
+            return {"object": random.choice(_FALLBACK_OBJECTS), "hint": _FALLBACK_HINT}
+
+    def hint_request(self, object_name: str, previous_hints: List[str]) -> Dict:
+        """Build the chat completion parameters for a hint request."""
+        previous_hints_str = "; ".join(previous_hints) if previous_hints else "none"
+        return {
+            "model": self.model_name,
+            "messages": [
+                self.hint_system_message,
+                object_message(object_name),
+                {"role": "user", "content": f"Previous hints: {previous_hints_str}"}
+            ],
+            "max_tokens": 60,
+            "temperature": 0.9,
+        }
+
+    def answer_request(self, object_name: str, question: str) -> Dict:
+        """Build the chat completion parameters for answering a question."""
+        # A single token, restricted to Yes/No/Maybe
+        return {
+            "model": self.model_name,
+            "messages": [
+                self.qa_system_message,
+                object_message(object_name),
+                {"role": "user", "content": question}
+            ],
+            "max_tokens": 1,
+            "temperature": 0,
+            "logit_bias": ANSWER_LOGIT_BIAS,
+        }
 
     @weave.op()
-    async def predict_hint(self, object_name: str, previous_hints: List[str]) -> Dict:
-        """Generate a hint for the given object."""
+    async def predict_hint(self, object_name: str, previous_hints: List[str],
+                           on_delta: Optional[Callable[[str], None]] = None) -> Dict:
+        """Generate a hint for the given object, streaming it to on_delta as it arrives.
+
+        An unseen precomputed hint is used first and sent to on_delta whole.
+        """
+        for hint in HINTS.get(object_name.lower(), []):
+            if hint not in previous_hints:
+                if on_delta is not None:
+                    on_delta(hint)
+                return {"hint": hint}
+
         try:
-            previous_hints_str = "; ".join(previous_hints) if previous_hints else "none"
-            response = await self.client.chat.completions.create(
-                model=self.model_name,
-                messages=[
-                    {"role": "system", "content": self.hint_prompt_template.format(
-                        object=object_name,
-                        previous_hints=previous_hints_str
-                    )}
-                ],
+            result = await stream_completion(
+                self.client,
+                on_delta,
+                **self.hint_request(object_name, previous_hints)
             )
-            result = response.choices[0].message.content
-            if result is None:
-                raise ValueError("No response from model")
-            return json.loads(result)
-        except Exception as e:
-            return {"hint": f"This object might be found in everyday life."}
+        except openai.APIError as e:
+            logger.warning("Hint generation failed, using a fallback hint: %r", e)
+            result = None
+        hint = (result or "").strip()
+        if not hint:
+            hint = _FALLBACK_HINT
+            if on_delta is not None:
+                on_delta(hint)
+        return {"hint": hint}
 
     @weave.op()
-    async def predict_answer(self, object_name: str, question: str) -> Dict:
+    async def predict_answer(self, object_name: str, question: str,
+                             on_delta: Optional[Callable[[str], None]] = None) -> Dict:
         """Generate an answer for the given question about the object."""
+        cache_key = (object_name, question.strip().lower())
+        cached = lookup_answer(cache_key)
+        if cached is not None:
+            if on_delta is not None:
+                on_delta(cached)
+            return {"answer": cached}
+
+        # Report the full word (e.g. "Maybe" rather than its first token "May"),
+        # matching what a cache hit sends; the empty retry reset passes through
+        show_answer = None
+        if on_delta is not None:
+            def show_answer(text: str) -> None:
+                on_delta((parse_answer(text) or "Maybe") if text else text)
         try:
-            response = await self.client.chat.completions.create(
-                model=self.model_name,
-                messages=[
-                    {"role": "system", "content": self.qa_prompt_template.format(
-                        object=object_name,
-                        question=question
-                    )}
-                ],
+            result = await stream_completion(
+                self.client,
+                show_answer,
+                answer_semaphore(),
+                **self.answer_request(object_name, question)
             )
-            result = response.choices[0].message.content
-            if result is None:
-                raise ValueError("No response from model")
-            return json.loads(result)
-        except Exception as e:
+        except openai.APIError as e:
+            logger.warning("Answer generation failed, answering Maybe: %r", e)
+            return {"answer": "Maybe"}
+        if result is None:
+            logger.warning("No answer from the model, answering Maybe")
             return {"answer": "Maybe"}
+        answer = parse_answer(result)
+        if answer is None:
+            # Not cached, so the question is asked again next time
+            logger.warning("Unrecognized answer %r, answering Maybe", result)
+            return {"answer": "Maybe"}
+        cache_answer(cache_key, answer)
+        return {"answer": answer}
+
+    async def submit_answer_batch(self, object_name: str, questions: List[str]) -> str:
+        """Submit questions to the Batch API (half price, 24h window), returning the batch id."""
+        lines = [
+            json.dumps({
+                "custom_id": str(i),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": self.answer_request(object_name, question),
+            })
+            for i, question in enumerate(questions)
+        ]
+        batch_input = io.BytesIO(("\n".join(lines) + "\n").encode())
+        batch_file = await self.client.files.create(file=("answers.jsonl", batch_input), purpose="batch")
+        batch = await self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+            # Read back by collect_answer_batch, along with the questions in the input file
+            metadata={"object": object_name},
+        )
+        return batch.id
+
+    async def collect_answer_batch(self, batch_id: str) -> Optional[List[Dict]]:
+        """Return the question and answer pairs from a submitted batch, or None if it isn't done.
+
+        The object and questions are read back from the batch itself, so answers can't be
+        cached against the wrong question. Raises RuntimeError if the batch failed, expired
+        or was cancelled, or completed without any output, so callers stop polling it.
+        """
+        batch = await self.client.batches.retrieve(batch_id)
+        if batch.status in _BATCH_TERMINAL_FAILURES or (
+            batch.status == "completed" and batch.output_file_id is None
+        ):
+            errors = ""
+            if batch.error_file_id is not None:
+                errors = (await self.client.files.content(batch.error_file_id)).text[:1000]
+            elif batch.errors is not None and batch.errors.data:
+                errors = "; ".join(str(error.message) for error in batch.errors.data)
+            raise RuntimeError(f"Answer batch {batch_id} ended with status {batch.status!r}: {errors}")
+        if batch.status != "completed":
+            return None
+
+        object_name = (batch.metadata or {}).get("object")
+        if object_name is None:
+            raise ValueError(f"Batch {batch_id} was not submitted by submit_answer_batch")
+        # The input file was written by submit_answer_batch, so it is trusted to parse
+        batch_input = await self.client.files.content(batch.input_file_id)
+        answers: Dict[str, Dict] = {}
+        for line in batch_input.text.splitlines():
+            request = json.loads(line)
+            question = request["body"]["messages"][-1]["content"]
+            answers[request["custom_id"]] = {"question": question, "answer": "Maybe"}
+
+        output = await self.client.files.content(batch.output_file_id)
+        for line in output.text.splitlines():
+            try:
+                result = json.loads(line)
+                response = result.get("response")
+                if not response or response["status_code"] != 200:
+                    continue
+                entry = answers[result["custom_id"]]
+                content = response["body"]["choices"][0]["message"]["content"]
+            except (*_JSON_ERRORS, IndexError) as e:
+                logger.warning("Skipping unreadable line in answer batch %s: %r", batch_id, e)
+                continue
+            answer = parse_answer(content or "")
+            if answer is None:
+                continue
+            entry["answer"] = answer
+            cache_answer((object_name, entry["question"].strip().lower()), answer)
+        return list(answers.values())
+
+    async def start_game(self) -> GameResponse:
+        """Pick a new object and its first hint."""
+        object_name = None if self.use_llm_objects else self.draw_object()
+        if object_name is None:
+            # Generate a new object together with its first hint
+            object_result = await self.predict_object_and_hint()
+            return GameResponse(
+                object_name=object_result["object"],
+                hints=[object_result["hint"]]
+            )
+        try:
+            hint_result = await self.predict_hint(object_name, [])
+        except BaseException:
+            # Put the object back so a failed or cancelled game doesn't use it up
+            self._object_pool.appendleft(object_name)
+            raise
+        return GameResponse(
+            object_name=object_name,
+            hints=[hint_result["hint"]]
+        )
+
+    def prefetch_next_game(self) -> None:
+        """Start the next game in the background, e.g. once 15 questions have been asked.
+
+        Safe to call from synchronous code or from a coroutine; the game is started on
+        the shared event loop and picked up by the next "new_game" prediction.
+        """
+        if self._next_game is None:
+            self._next_game = asyncio.run_coroutine_threadsafe(self.start_game(), get_event_loop())
+
+    async def _take_prefetched_game(self, future: concurrent.futures.Future) -> Optional[GameResponse]:
+        """Return the prefetched game, or None if it failed or was cancelled."""
+        # Waiting rather than awaiting the future directly keeps a cancelled prefetch
+        # apart from a cancellation of this call, which still propagates
+        prefetched = asyncio.wrap_future(future)
+        try:
+            await asyncio.wait([prefetched])
+        except asyncio.CancelledError:
+            prefetched.cancel()
+            raise
+        if prefetched.cancelled():
+            logger.warning("Prefetched game was cancelled, starting a new one")
+            return None
+        if prefetched.exception() is not None:
+            logger.warning("Prefetched game failed, starting a new one: %r", prefetched.exception())
+            return None
+        return prefetched.result()
+
+    async def predict_answers(self, object_name: str, questions: List[str]) -> List[Dict]:
+        """Answer several independent questions about the object concurrently."""
+        return list(await asyncio.gather(
+            *(self.predict_answer(object_name, question) for question in questions)
+        ))
 
     @weave.op()
     async def predict(self, input_data: Dict) -> GameResponse:
         """Main predict function that handles different types of predictions."""
         if input_data.get("type") == "new_game":
-            # Generate a new object
-            object_result = await self.predict_object()
-            return GameResponse(
-                object_name=object_result["object"],
-                hints=[]
-            )
+            # Use the prefetched game if there is one, otherwise start from scratch
+            next_game, self._next_game = self._next_game, None
+            if next_game is not None:
+                game_response = await self._take_prefetched_game(next_game)
+                if game_response is not None:
+                    return game_response
+            return await self.start_game()
         
         elif input_data.get("type") == "hint":
             # Generate a hint for existing object
@@ -159,37 +601,67 @@ class TwentyQuestionsModel(weave.Model):
                 qa_response=answer_result["answer"]
             )
         
+        elif input_data.get("type") == "questions":
+            # Answer a batch of pending questions concurrently
+            answer_results = await self.predict_answers(
+                input_data["object"],
+                input_data["questions"]
+            )
+            return GameResponse(
+                object_name=input_data["object"],
+                hints=[],
+                qa_responses=[result["answer"] for result in answer_results]
+            )
+        
         else:
             raise ValueError("Invalid prediction type")
 
 # Example usage:
 async def main():
     # Initialize Weave with the project name
-    weave.init("wandb-designers/20questions")
+    init_weave()
+    
+    try:
+        # Initialize model
+        model = TwentyQuestionsModel()
+    
+        # Start new game
+        game_response = await model.predict({"type": "new_game"})
+        print(f"Generated object: {game_response.object_name}")
+        print(f"First hint: {game_response.hints[0]}")
     
-    # Initialize model
-    model = TwentyQuestionsModel()
+        # Get another hint
+        hint_response = await model.predict({
+            "type": "hint",
+            "object": game_response.object_name,
+            "previous_hints": game_response.hints
+        })
+        print(f"Hint: {hint_response.hints[0]}")
     
-    # Start new game
-    game_response = await model.predict({"type": "new_game"})
-    print(f"Generated object: {game_response.object_name}")
+        # Ask a question
+        qa_response = await model.predict({
+            "type": "question",
+            "object": game_response.object_name,
+            "question": "Is it electronic?"
+        })
+        print(f"Answer: {qa_response.qa_response}")
     
-    # Get a hint
-    hint_response = await model.predict({
-        "type": "hint",
-        "object": game_response.object_name,
-        "previous_hints": []
-    })
-    print(f"Hint: {hint_response.hints[0]}")
+        # Ask a batch of questions at once
+        questions = ["Is it bigger than a bread box?", "Is it made of metal?", "Can you eat it?"]
+        batch_response = await model.predict({
+            "type": "questions",
+            "object": game_response.object_name,
+            "questions": questions
+        })
+        for question, answer in zip(questions, batch_response.qa_responses):
+            print(f"{question} {answer}")
     
-    # Ask a question
-    qa_response = await model.predict({
-        "type": "question",
-        "object": game_response.object_name,
-        "question": "Is it electronic?"
-    })
-    print(f"Answer: {qa_response.qa_response}")
+        # Prepare the next game while the player is still guessing
+        model.prefetch_next_game()
+        next_game_response = await model.predict({"type": "new_game"})
+        print(f"Next object: {next_game_response.object_name}")
+    finally:
+        await close_client()
 
 if __name__ == "__main__":
-    import asyncio
-    asyncio.run(main())
\ No newline at end of file
+    run(main())
\ No newline at end of file
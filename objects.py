@@ -0,0 +1,49 @@
+"""Curated pool of common objects for new games."""
+
+# Everyday objects a child would recognize, drawn from instead of asking the model
+OBJECTS_LARGE = (
+    "pencil", "pen", "eraser", "ruler", "stapler", "scissors", "notebook", "book",
+    "magazine", "newspaper", "envelope", "stamp", "tape", "glue", "crayon", "marker",
+    "paperclip", "calendar", "folder", "backpack", "spoon", "fork", "knife", "plate",
+    "bowl", "cup", "mug", "glass", "bottle", "jar", "pot", "pan", "kettle", "teapot",
+    "toaster", "blender", "microwave", "oven", "refrigerator", "freezer", "spatula",
+    "whisk", "ladle", "colander", "grater", "peeler", "corkscrew", "napkin", "placemat",
+    "tablecloth", "apron", "oven mitt", "cutting board", "rolling pin", "lunchbox",
+    "thermos", "straw", "tray", "sponge", "dish soap", "chair", "table", "sofa",
+    "couch", "bed", "pillow", "blanket", "sheet", "mattress", "desk", "stool", "bench",
+    "bookshelf", "drawer", "dresser", "wardrobe", "cabinet", "shelf", "mirror", "lamp",
+    "clock", "watch", "calculator", "telephone", "radio", "remote", "keyboard", "mouse",
+    "speaker", "headphones", "camera", "flashlight", "battery", "charger", "candle",
+    "vase", "rug", "carpet", "curtain", "window", "door", "doorknob", "key", "lock",
+    "doormat", "picture frame", "painting", "poster", "coaster", "basket", "bucket",
+    "broom", "mop", "dustpan", "vacuum", "trash can", "hanger", "iron",
+    "laundry basket", "clothespin", "detergent", "towel", "washcloth", "soap",
+    "shampoo", "toothbrush", "toothpaste", "comb", "hairbrush", "razor", "tissue",
+    "toilet paper", "bathtub", "shower", "sink", "faucet", "toilet", "plunger", "scale",
+    "cotton ball", "bandage", "thermometer", "hairdryer", "nail clipper", "shirt",
+    "pants", "shorts", "skirt", "dress", "jacket", "coat", "sweater", "scarf", "hat",
+    "cap", "glove", "mitten", "sock", "shoe", "boot", "sandal", "slipper", "belt",
+    "tie", "button", "zipper", "pocket", "umbrella", "wallet", "purse", "handbag",
+    "suitcase", "ring", "necklace", "bracelet", "earring", "sunglasses", "glasses",
+    "apple", "banana", "orange", "grape", "lemon", "strawberry", "watermelon", "pear",
+    "peach", "cherry", "pineapple", "carrot", "potato", "tomato", "onion", "lettuce",
+    "cucumber", "broccoli", "corn", "pumpkin", "bread", "cheese", "egg", "butter",
+    "milk", "cereal", "cookie", "cake", "pie", "sandwich", "pizza", "rice", "pasta",
+    "soup", "honey", "jam", "peanut butter", "chocolate", "candy", "popcorn", "salt",
+    "pepper", "sugar", "flour", "coffee", "tea", "juice", "ice cream", "yogurt",
+    "cracker", "pretzel", "muffin", "pancake", "ball", "balloon", "kite", "puzzle",
+    "doll", "teddy bear", "yo yo", "marble", "dice", "jump rope", "frisbee",
+    "skateboard", "bicycle", "scooter", "tricycle", "wagon", "sled", "swing", "slide",
+    "guitar", "drum", "piano", "whistle", "bell", "harmonica", "hammer", "screwdriver",
+    "wrench", "nail", "screw", "saw", "drill", "ladder", "shovel", "rake", "hose",
+    "wheelbarrow", "flowerpot", "watering can", "seed", "leaf", "flower", "car", "coin",
+    "dollar", "card", "ticket", "map", "globe", "compass", "magnet", "rubber band",
+    "string", "rope", "chain", "paper", "cardboard", "box", "bag", "plastic bag",
+    "mailbox", "light bulb", "switch", "outlet", "plug", "fan", "heater", "desk lamp",
+    "alarm clock", "doorbell", "pillowcase", "quilt", "hammock", "cushion", "beanbag",
+    "block", "pencil case", "chalk", "chalkboard", "whiteboard", "sticky note",
+    "highlighter", "binder", "clipboard", "hole punch", "push pin", "thumbtack",
+    "fridge magnet", "ice tray", "cookie jar", "bread box", "salt shaker",
+    "pepper grinder", "sugar bowl", "chopsticks", "toothpick", "dishwasher",
+    "washing machine", "dryer", "bathrobe", "pajamas", "nightlight",
+)
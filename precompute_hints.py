@@ -0,0 +1,91 @@
+"""Pre-generate hints offline with the OpenAI Batch API.
+
+Usage:
+    python precompute_hints.py submit [object ...]
+    python precompute_hints.py collect <batch_id>
+
+`submit` uploads one request per (object, hint index) and prints the batch id.
+`collect` downloads the finished batch and merges the hints into hints.json,
+which TwentyQuestionsModel.predict_hint serves before making a live call.
+"""
+import io
+import json
+import sys
+from typing import Dict, List
+
+import openai
+
+from app import HINTS_PATH, TwentyQuestionsModel, api_key
+from objects import OBJECTS_LARGE
+
+HINTS_PER_OBJECT = 5
+
+
+def build_requests(objects: List[str]) -> str:
+    """Build the batch input JSONL, one chat completion request per hint."""
+    model = TwentyQuestionsModel()
+    lines = []
+    for object_name in objects:
+        for i in range(HINTS_PER_OBJECT):
+            lines.append(json.dumps({
+                "custom_id": f"{object_name}::{i}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": model.hint_request(object_name, []),
+            }))
+    return "\n".join(lines) + "\n"
+
+
+def submit(client: openai.OpenAI, objects: List[str]) -> str:
+    """Upload the requests and start a batch, returning its id."""
+    batch_input = io.BytesIO(build_requests(objects).encode())
+    batch_file = client.files.create(file=("hints.jsonl", batch_input), purpose="batch")
+    batch = client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+    )
+    return batch.id
+
+
+def collect(client: openai.OpenAI, batch_id: str) -> Dict[str, List[str]]:
+    """Download a completed batch and merge its hints into hints.json."""
+    batch = client.batches.retrieve(batch_id)
+    if batch.status != "completed" or batch.output_file_id is None:
+        raise RuntimeError(f"Batch {batch_id} is not complete (status: {batch.status})")
+
+    try:
+        with open(HINTS_PATH) as f:
+            hints: Dict[str, List[str]] = json.load(f)
+    except FileNotFoundError:
+        hints = {}
+
+    for line in client.files.content(batch.output_file_id).text.splitlines():
+        result = json.loads(line)
+        response = result.get("response")
+        if not response or response["status_code"] != 200:
+            continue
+        object_name = result["custom_id"].split("::")[0].lower()
+        hint = (response["body"]["choices"][0]["message"]["content"] or "").strip()
+        if hint and hint not in hints.setdefault(object_name, []):
+            hints[object_name].append(hint)
+
+    with open(HINTS_PATH, "w") as f:
+        json.dump(hints, f, indent=2)
+    return hints
+
+
+def main(argv: List[str]) -> None:
+    client = openai.OpenAI(api_key=api_key)
+    if len(argv) >= 1 and argv[0] == "submit":
+        print(submit(client, argv[1:] or OBJECTS_LARGE))
+    elif len(argv) == 2 and argv[0] == "collect":
+        hints = collect(client, argv[1])
+        print(f"Wrote hints for {len(hints)} objects to {HINTS_PATH}")
+    else:
+        print(__doc__)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])